@@ -1,28 +1,38 @@
 #!/bin/env python3
 
+from __future__ import annotations
+
 import configparser
-import dataclasses
-import datetime
+import functools
+import hashlib
+import io
 import logging
+import os
 import pathlib
+import pickle
 import random
 import re
+import shutil
 import sys
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import field
-from typing import Any, Protocol
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
 
 import questionary
-from halo import Halo
-from jira import JIRA
-from jira.client import ResultList
-from jira.exceptions import JIRAError
-from jira.resources import Issue
-from requests.exceptions import ConnectionError as RequestsConnectionError
-from requests.exceptions import ReadTimeout as RequestsReadTimeout
-from requests.exceptions import RequestException
-from urllib3.exceptions import ReadTimeoutError as Urllib3ReadTimeout
+
+if TYPE_CHECKING:
+    # jira, requests and halo are imported where they are first used; importing
+    # them takes longer than everything else the first prompt needs.
+    from halo import Halo
+    from jira import JIRA
+    from jira.client import ResultList
+    from jira.resources import Issue
+    from requests.adapters import HTTPAdapter
 
 logging.basicConfig(level=logging.INFO)
 
@@ -30,25 +40,92 @@ logging.basicConfig(level=logging.INFO)
 DEFAULT_ISSUE_JQL = "assignee=currentUser() AND statusCategory not in (Done)"
 DEFAULT_TEAM_ISSUE_JQL = ""  # Optional, user can configure later
 REQUEST_TIMEOUT_SECONDS = 3
+# The timer spinner runs for as long as the user works; redraw it slowly
+TIMER_SPINNER_INTERVAL_MS = 500
+# Enough keep-alive connections for the main thread and the view prefetch
+# workers to share one client without queueing.
+HTTP_POOL_MAXSIZE = 8
+# Self-hosted servers may be configured with a plain http:// URL
+HTTP_ADAPTER_PREFIXES = ("https://", "http://")
+# Failed connects of the login probe are retried by its adapter; the request was
+# never sent, so a retry is always safe. Once the adapter is handed to the
+# client, jira's ResilientSession does its own connect retries instead.
+HTTP_CONNECT_RETRIES = 2
+SEARCH_CACHE_TTL_SECONDS = 300
 SEARCH_RESULT_LIMIT = 50
+ISSUE_CACHE_SIZE = 512
 SEARCH_BY_TEXT_VALUE = "__search_by_text__"
 SEARCH_BY_JQL_VALUE = "__search_by_jql__"
 MANUAL_ENTRY_VALUE = "__manual_entry__"
 RETURN_TO_VIEWS_VALUE = "__return_to_views__"
+RELOAD_RESULTS_VALUE = "__reload_results__"
 RETURN_TO_LOG_METHOD_VALUE = "__return_to_log_method__"
 VIEW_MY_ISSUES = "__view_my_issues__"
 VIEW_TEAM_ISSUES = "__view_team_issues__"
 VIEW_PROJECT_ISSUES = "__view_project_issues__"
 
+# Only what the issue pickers display; keyword searches match descriptions
+# server-side, so they never need to be downloaded. The key and id are part of
+# every issue in the response and need not be requested.
 ISSUE_FIELDS = [
-    "id",
-    "key",
     "summary",
-    "statusCategory",
     "status",
-    "description",
 ]
+# jira rewrites a fields list in place while translating field names, so
+# searches pass this string, which it splits into a fresh list per call.
+ISSUE_FIELDS_CSV = ",".join(ISSUE_FIELDS)
 ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+JQL_ESCAPE_TABLE = str.maketrans({'"': '\\"', "\\": "\\\\"})
+JQL_ORDER_BY_UPDATED = " ORDER BY updated DESC"
+
+LOG_METHOD_CHOICES = (
+    questionary.Choice(
+        title="Start Timer",
+        description="Begin a timer now and stop it when you're done.",
+        value="auto",
+        shortcut_key="t",
+    ),
+    questionary.Choice(
+        title="Manual Time Entry",
+        description='Enter a duration such as "1h" or "30m".',
+        value="manual",
+        shortcut_key="m",
+    ),
+    questionary.Choice(
+        title="Back to issue selection",
+        description="Return and pick a different issue.",
+        value=RETURN_TO_LOG_METHOD_VALUE,
+        shortcut_key="b",
+    ),
+)
+YES_NO_CHOICES = (
+    questionary.Choice(title="Yes.", value=True),
+    questionary.Choice(title="No.", value=False),
+)
+RETRY_WORKLOG_CHOICES = (
+    questionary.Choice(title="Yes, retry.", value=True),
+    questionary.Choice(title="No, cancel.", value=False),
+)
+RETRY_ISSUE_CHOICES = (
+    questionary.Choice(title="Yes, retry.", value=True),
+    questionary.Choice(title="No, go back to selection.", value=False),
+)
+
+
+@functools.cache
+def shared_spinner(*, text: str, spinner: str, interval: int = -1) -> Halo:
+    """Return one reusable spinner per text, style and frame interval.
+
+    Halo registers an atexit hook and allocates terminal state per instance, so
+    instances are shared and simply restarted instead of built per search.
+    Spinners are disabled when stdout is not a terminal. ``interval`` is in
+    milliseconds; the default keeps the style's own frame rate.
+    """
+    from halo import Halo
+
+    return Halo(
+        text=text, spinner=spinner, interval=interval, enabled=sys.stdout.isatty()
+    )
 
 
 class QuestionaryIO:
@@ -70,7 +147,33 @@ class QuestionaryIO:
         questionary.print(*args, **kwargs)
 
 
-@dataclasses.dataclass(kw_only=True)
+def _new_config_parser() -> configparser.ConfigParser:
+    """Return a parser for the server config file.
+
+    Values are used verbatim, so a ``%`` in a token or JQL needs no escaping.
+    The ``[DEFAULT]`` section keeps its usual meaning of values shared by all
+    servers, so that name is not available for a server.
+    """
+    return configparser.ConfigParser(interpolation=None)
+
+
+@functools.cache
+def _jira_call_errors() -> tuple[type[Exception], ...]:
+    """Return the exceptions a failed Jira call raises, importing them lazily."""
+    from jira.exceptions import JIRAError
+    from requests.exceptions import RequestException
+    from urllib3.exceptions import ReadTimeoutError
+
+    return (JIRAError, RequestException, ReadTimeoutError)
+
+
+def _normalize_project_keys(keys: Iterable[str]) -> list[str]:
+    """Strip, upper-case and de-duplicate project keys, keeping their order."""
+    normalized = (key.strip().upper() for key in keys)
+    return list(dict.fromkeys(key for key in normalized if key))
+
+
+@dataclass(kw_only=True, slots=True)
 class Server:
     auth_type: str = "pat"
     url: str
@@ -81,56 +184,70 @@ class Server:
     issue_jql: str = DEFAULT_ISSUE_JQL
     team_issue_jql: str = DEFAULT_TEAM_ISSUE_JQL
     project_keys: list[str] = field(default_factory=list)
+    # Derived from the fields above once, when the server is built
+    project_jql: str | None = field(init=False, default=None, repr=False, compare=False)
+    choice_title: str = field(init=False, default="", repr=False, compare=False)
+    # The authenticated user's profile, once a connection has been made
+    profile: dict[str, Any] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        self.auth_type = self.auth_type.strip()
-        self.url = self.url.strip()
-        self.name = self.name.strip()
-        self.pat = self.pat.strip()
-        self.email = self.email.strip()
-        self.api_token = self.api_token.strip()
-        self.issue_jql = (self.issue_jql or DEFAULT_ISSUE_JQL).strip()
-        self.team_issue_jql = (self.team_issue_jql or "").strip()
-        normalized_project_keys: list[str] = []
-        seen_projects: set[str] = set()
-        for key in self.project_keys:
-            if not key:
-                continue
-            normalized = key.strip().upper()
-            if not normalized or normalized in seen_projects:
-                continue
-            seen_projects.add(normalized)
-            normalized_project_keys.append(normalized)
-        self.project_keys = normalized_project_keys
+        # Values are normalized where they are read, by the config loader and
+        # the new-server prompts; only the derived fields are filled in here.
+        project_list = ", ".join(self.project_keys)
+        self.project_jql = (
+            f"project in ({project_list}) AND statusCategory not in (Done)"
+            if project_list
+            else None
+        )
+        self.choice_title = f"{self.name} - {self.url}"
 
 
 class Config:
     def __init__(self) -> None:
         self.servers: list[Server] = []
-        self.config_dir = pathlib.Path.home().joinpath(
-            pathlib.Path(".config/jira-time/")
-        )
-        self.config_path = self.config_dir.joinpath("jira-time.conf")
+        self._config_dir: pathlib.Path | None = None
         self._parser: configparser.ConfigParser = None
 
+    @property
+    def config_dir(self) -> pathlib.Path:
+        # Resolve the home directory on first use, not when Config is built
+        if self._config_dir is None:
+            self._config_dir = pathlib.Path.home().joinpath(
+                pathlib.Path(".config/jira-time/")
+            )
+        return self._config_dir
+
+    @property
+    def config_path(self) -> pathlib.Path:
+        return self.config_dir.joinpath("jira-time.conf")
+
     def load(self) -> None:
-        # Ensure config file exists and if not create it
-        self.config_dir.mkdir(exist_ok=True)
-        self.config_path.touch(exist_ok=True)
+        self._parser = _new_config_parser()
+        try:
+            text = self.config_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            # Nothing configured yet; the file is created on the first write
+            self.servers = []
+            return
+        self._parser.read_string(text, source=str(self.config_path))
 
-        self._parser = configparser.ConfigParser()
-        self._parser.read(filenames=self.config_path, encoding="utf-8")
+        self.servers = list(self._iter_servers())
 
-        self.servers: list[Server] = []
+    def _iter_servers(self) -> Iterator[Server]:
         for section in self._parser.sections():
             url = self._parser.get(section=section, option="url")
             auth_type = self._parser.get(
                 section=section, option="auth_type", fallback="pat"
             )
-            issue_jql = self._parser.get(
-                section=section,
-                option="issue_jql",
-                fallback=DEFAULT_ISSUE_JQL,
+            issue_jql = (
+                self._parser.get(
+                    section=section,
+                    option="issue_jql",
+                    fallback=DEFAULT_ISSUE_JQL,
+                )
+                or DEFAULT_ISSUE_JQL
             )
             team_issue_jql = self._parser.get(
                 section=section,
@@ -142,7 +259,7 @@ class Config:
                 option="project_keys",
                 fallback="",
             )
-            project_keys = [key for key in project_keys_raw.split(",") if key]
+            project_keys = _normalize_project_keys(project_keys_raw.split(","))
 
             if auth_type == "pat":
                 pat = self._parser.get(section=section, option="pat", fallback="")
@@ -150,16 +267,14 @@ class Config:
                     raise Exception(
                         f'The config file {self.config_path} must define a non-empty PAT for section "{section}".'
                     )
-                self.servers.append(
-                    Server(
-                        auth_type=auth_type,
-                        url=url,
-                        name=section,
-                        pat=pat,
-                        issue_jql=issue_jql,
-                        team_issue_jql=team_issue_jql,
-                        project_keys=project_keys,
-                    )
+                yield Server(
+                    auth_type=auth_type,
+                    url=url,
+                    name=section.strip(),
+                    pat=pat,
+                    issue_jql=issue_jql,
+                    team_issue_jql=team_issue_jql,
+                    project_keys=project_keys,
                 )
                 continue
 
@@ -172,17 +287,15 @@ class Config:
                     raise Exception(
                         f'The config file {self.config_path} must define both an email and API token for section "{section}".'
                     )
-                self.servers.append(
-                    Server(
-                        auth_type=auth_type,
-                        url=url,
-                        name=section,
-                        email=email,
-                        api_token=api_token,
-                        issue_jql=issue_jql,
-                        team_issue_jql=team_issue_jql,
-                        project_keys=project_keys,
-                    )
+                yield Server(
+                    auth_type=auth_type,
+                    url=url,
+                    name=section.strip(),
+                    email=email,
+                    api_token=api_token,
+                    issue_jql=issue_jql,
+                    team_issue_jql=team_issue_jql,
+                    project_keys=project_keys,
                 )
                 continue
 
@@ -190,11 +303,25 @@ class Config:
                 f"""The config file {self.config_path} has set the "auth_type" for section "{section}" to "{auth_type}" but only "pat" and "cloud_token" are supported now."""
             )
 
-    def write(self, autoreload: bool = True) -> None:
-        with open(self.config_path, "w") as f:
-            self._parser.write(f)
+    def write(self, autoreload: bool = False) -> None:
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Render to memory and swap the file in one step, so a crash mid-write
+        # never leaves a truncated config with half of the credentials.
+        buf = io.StringIO()
+        self._parser.write(buf)
+        tmp_path = self.config_path.with_suffix(".conf.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(buf.getvalue())
+            # Make sure the data is on disk before it replaces the old file
+            f.flush()
+            os.fsync(f.fileno())
+        if self.config_path.exists():
+            shutil.copymode(self.config_path, tmp_path)
+        os.replace(tmp_path, self.config_path)
         if autoreload:
-            self.load()
+            # The in-memory parser is what was just written; no need to read
+            # the file back.
+            self.servers = list(self._iter_servers())
 
     def add_server(self, s: Server) -> None:
         section = s.name
@@ -223,6 +350,132 @@ class Config:
                 f"Unsupported auth_type '{s.auth_type}' for server '{s.name}'"
             )
         self.write()
+        # The new section is already normalized, so patch it in instead of
+        # re-reading the whole file.
+        self.servers = [srv for srv in self.servers if srv.name != s.name] + [s]
+
+
+class SearchCache:
+    """Short-lived on-disk cache of JQL search results.
+
+    Entries are keyed by ``(server url, jql, fields, limit)`` and store the raw
+    issue JSON so that repeated searches, including ones from a previous run,
+    can skip the round-trip to Jira. Empty result sets are cached as well.
+    ``scope`` names the account the results belong to, normally the configured
+    server name, so that ``currentUser()`` searches by two accounts on the same
+    server never share entries. Expired entries are pruned on every write.
+    """
+
+    def __init__(
+        self,
+        cache_dir: pathlib.Path | None = None,
+        ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS,
+        *,
+        scope: str = "",
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+        self._scope = scope
+
+    @property
+    def cache_dir(self) -> pathlib.Path:
+        # Resolve the home directory on first use only
+        if self._cache_dir is None:
+            self._cache_dir = pathlib.Path.home().joinpath(
+                pathlib.Path(".config/jira-time/cache/")
+            )
+        return self._cache_dir
+
+    def get(self, key: tuple[Any, ...]) -> list[dict[str, Any]] | None:
+        path = self._path_for(key)
+        entry = self._read(path)
+        if entry is None:
+            return None
+        stored_at, raw_issues = entry
+        if time.time() - stored_at > self._ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return raw_issues
+
+    def put(self, key: tuple[Any, ...], raw_issues: list[dict[str, Any]]) -> None:
+        path = self._path_for(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_expired()
+            with open(path, "wb") as f:
+                pickle.dump(
+                    (time.time(), raw_issues), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+        except OSError as ex:
+            logging.debug("Could not write search cache entry %s: %s", path, ex)
+
+    def discard_issue(self, issue_key: str) -> None:
+        """Drop every cached result set that contains the given issue."""
+        if not self.cache_dir.is_dir():
+            return
+        for path in self._prune_expired():
+            entry = self._read(path)
+            if entry is None or any(raw.get("key") == issue_key for raw in entry[1]):
+                path.unlink(missing_ok=True)
+
+    def _prune_expired(self) -> list[pathlib.Path]:
+        """Delete expired entries and return the paths of the remaining ones.
+
+        Entries are written in one go, so the file's modification time is the
+        time it was stored and nothing needs to be unpickled.
+        """
+        cutoff = time.time() - self._ttl_seconds
+        live: list[pathlib.Path] = []
+        for path in self.cache_dir.glob("*.pickle"):
+            try:
+                expired = path.stat().st_mtime < cutoff
+            except FileNotFoundError:
+                continue
+            if expired:
+                path.unlink(missing_ok=True)
+            else:
+                live.append(path)
+        return live
+
+    def _path_for(self, key: tuple[Any, ...]) -> pathlib.Path:
+        digest = hashlib.blake2b(
+            repr((self._scope, *key)).encode("utf-8"), digest_size=16
+        )
+        return self.cache_dir.joinpath(f"{digest.hexdigest()}.pickle")
+
+    def _read(self, path: pathlib.Path) -> tuple[float, list[dict[str, Any]]] | None:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError) as ex:
+            logging.debug("Ignoring unreadable search cache entry %s: %s", path, ex)
+            path.unlink(missing_ok=True)
+            return None
+
+
+class IssueCache(OrderedDict[str, "Issue"]):
+    """Issues seen during a session, keyed by issue key.
+
+    Holds at most ``maxsize`` issues and evicts the least recently used one
+    when full, so long sessions with many searches keep a bounded footprint.
+    """
+
+    def __init__(self, maxsize: int = ISSUE_CACHE_SIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: str) -> Issue:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Issue) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
 
 
 class ServerPrompter:
@@ -273,9 +526,7 @@ class ServerPrompter:
             message="Optional Jira project keys for broader searches (comma separated):",
             default="",
         ).strip()
-        project_keys = [
-            key.strip() for key in project_keys_input.split(",") if key.strip()
-        ]
+        project_keys = _normalize_project_keys(project_keys_input.split(","))
 
         if auth_type == "pat":
             pat = self._prompt.password(
@@ -321,19 +572,29 @@ class ServerPrompter:
         )
 
     def _validate_server_name(self, config: "Config") -> Callable[[str], str | bool]:
+        # questionary re-validates on every keystroke, so snapshot the names once
+        taken = frozenset(
+            section.strip().casefold() for section in config._parser.sections()
+        )
+        reserved = config._parser.default_section.casefold()
+
         def validate(name: str) -> str | bool:
-            if len(name) <= 0:
+            if not name:
                 return "Please, enter a name for the server!"
-            if config._parser.has_section(name):
+            folded = name.strip().casefold()
+            if folded == reserved:
+                return "That name is reserved, please choose another one!"
+            if folded in taken:
                 return "Name is already taken, please choose another one!"
             return True
 
         return validate
 
 
-def add_new_server(config: "Config", prompter: ServerPrompter) -> None:
+def add_new_server(config: "Config", prompter: ServerPrompter) -> Server:
     server = prompter.prompt_for_new_server(config)
     config.add_server(server)
+    return server
 
 
 class AuthStrategy(Protocol):
@@ -371,42 +632,29 @@ class CloudTokenAuthStrategy:
         server: Server,
         connector: Callable[..., tuple[JIRA, dict[str, Any]]],
     ) -> tuple[JIRA, dict[str, Any]]:
-        errors: list[JIRAError] = []
-
-        if server.email and server.api_token:
-            try:
-                return connector(basic_auth=(server.email, server.api_token))
-            except JIRAError as ex:
-                if ex.status_code != 401:
-                    raise
-                logging.debug(
-                    "Authentication method '%s' failed for server '%s': %s",
-                    "email+api_token",
-                    server.name,
-                    ex.text,
-                )
-                errors.append(ex)
+        from jira.exceptions import JIRAError
 
-        if server.api_token:
-            try:
-                return connector(token_auth=server.api_token)
-            except JIRAError as ex:
-                if ex.status_code != 401:
-                    raise
-                logging.debug(
-                    "Authentication method '%s' failed for server '%s': %s",
-                    "bearer",
-                    server.name,
-                    ex.text,
-                )
-                errors.append(ex)
-
-        if errors:
-            raise errors[-1]
+        if not server.api_token:
+            raise ValueError(
+                f"Incomplete Jira Cloud credentials for server '{server.name}'."
+            )
+        if "@" not in server.email:
+            # Basic auth needs the account email; a bare token is a bearer token
+            return connector(token_auth=server.api_token)
 
-        raise ValueError(
-            f"Incomplete Jira Cloud credentials for server '{server.name}'."
-        )
+        try:
+            return connector(basic_auth=(server.email, server.api_token))
+        except JIRAError as ex:
+            # Only a 401 means the method itself was rejected; anything else,
+            # such as a 403 for missing permissions, would fail for bearer too.
+            if ex.status_code != 401:
+                raise
+            logging.debug(
+                "Authentication method 'email+api_token' failed for server '%s': %s",
+                server.name,
+                ex.text,
+            )
+        return connector(token_auth=server.api_token)
 
 
 class JiraAuthenticator:
@@ -427,12 +675,19 @@ class JiraAuthenticator:
 
 
 class JiraService:
-    def __init__(self, client: JIRA) -> None:
+    def __init__(self, client: JIRA, search_cache: SearchCache | None = None) -> None:
         self._client = client
+        self._search_cache = search_cache
+        self._fields_lock = threading.Lock()
         self._max_attempts = 3
         self._base_delay = 1.0
 
     def _is_transient(self, ex: Exception) -> bool:
+        from jira.exceptions import JIRAError
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+        from requests.exceptions import ReadTimeout as RequestsReadTimeout
+        from urllib3.exceptions import ReadTimeoutError as Urllib3ReadTimeout
+
         if isinstance(
             ex, (RequestsConnectionError, RequestsReadTimeout, Urllib3ReadTimeout)
         ):
@@ -474,18 +729,45 @@ class JiraService:
         self,
         jql: str,
         *,
-        fields: list[str],
+        fields: str | list[str],
         limit: int | None = None,
+        refresh: bool = False,
     ) -> list[Issue]:
+        """Run a JQL search, reusing a cached result unless ``refresh`` is set.
+
+        A refreshed search still stores its result for later calls.
+        """
+        from jira.resources import Issue
+
+        fields_csv = fields if isinstance(fields, str) else ",".join(fields)
+        cache_key = (self._client.server_url, jql, fields_csv, limit)
+        if self._search_cache is not None and not refresh:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return [
+                    Issue(self._client._options, self._client._session, raw=raw)
+                    for raw in cached
+                ]
+
         search_kwargs: dict[str, Any] = {
             "jql_str": jql,
             "fields": fields,
         }
         search_kwargs["maxResults"] = False if limit is None else limit
-        results: ResultList[Issue] = self._retry(
-            "search issues", lambda: self._client.search_issues(**search_kwargs)
-        )
-        return list(results)
+
+        def _search() -> ResultList[Issue]:
+            with self._fields_lock:
+                # jira loads its field catalogue on the first search; make the
+                # concurrent prefetches wait for one load instead of each
+                # fetching it
+                self._client._fields_cache
+            return self._client.search_issues(**search_kwargs)
+
+        results: ResultList[Issue] = self._retry("search issues", _search)
+        issues = list(results)
+        if self._search_cache is not None:
+            self._search_cache.put(cache_key, [issue.raw for issue in issues])
+        return issues
 
     def get_issue(self, issue_key: str, *, fields: list[str] | None = None) -> Issue:
         return self._retry(
@@ -509,42 +791,205 @@ class JiraService:
             )
 
         self._retry("add worklog", _call)
+        if self._search_cache is not None:
+            self._search_cache.discard_issue(issue_key)
+
+
+def _probe_auth(
+    url: str,
+    adapter: HTTPAdapter,
+    *,
+    basic_auth: tuple[str, str] | None = None,
+    token_auth: str | None = None,
+) -> dict[str, Any]:
+    """Fetch the current user's profile with the given credentials.
+
+    Raises ``JIRAError`` with the response status when Jira rejects the call,
+    so a 401 can be told apart from other failures without building a client.
+    """
+    import requests
+    from jira.client import TokenAuth
+    from jira.exceptions import JIRAError
+    from requests.exceptions import ReadTimeout as RequestsReadTimeout
+    from urllib3.exceptions import ReadTimeoutError as Urllib3ReadTimeout
+
+    session = requests.Session()
+    for prefix in HTTP_ADAPTER_PREFIXES:
+        session.mount(prefix, adapter)
+    session.auth = TokenAuth(token_auth) if token_auth else basic_auth
+    myself_url = f"{url.rstrip('/')}/rest/api/2/myself"
+    # Allow a couple of retries for transient faults; failed connects are
+    # already retried by the adapter
+    attempts = 3
+    last_ex: Exception | None = None
+    for i in range(1, attempts + 1):
+        try:
+            response = session.get(
+                myself_url,
+                headers={"Accept": "application/json"},
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+        except (RequestsReadTimeout, Urllib3ReadTimeout) as ex:
+            last_ex = ex
+        else:
+            if response.ok:
+                return response.json()
+            last_ex = JIRAError(
+                text=response.text,
+                status_code=response.status_code,
+                url=myself_url,
+                request=response.request,
+                response=response,
+            )
+            if response.status_code not in {429, 500, 502, 503, 504}:
+                break
+        if i < attempts:
+            time.sleep(0.5 * (2 ** (i - 1)))
+    assert last_ex is not None
+    raise last_ex
 
 
 def connect_to_jira(server: Server) -> tuple[JIRA, dict[str, Any]]:
-    """Create an authenticated JIRA client for the given server configuration."""
+    """Create an authenticated JIRA client for the given server configuration.
+
+    The client keeps its HTTP connections alive, so callers should create it
+    once per session and reuse it for every search, lookup and worklog.
+    """
+    from jira import JIRA
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
     def _attempt_connection(**auth_kwargs: Any) -> tuple[JIRA, dict[str, Any]]:
+        # Check the credentials with one cheap call before building the client;
+        # the probe's adapter, and its open connection, is handed over to it.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=HTTP_CONNECT_RETRIES,
+                connect=HTTP_CONNECT_RETRIES,
+                read=False,
+                status=0,
+                other=0,
+                backoff_factor=0.3,
+            ),
+        )
+        profile = _probe_auth(server.url, adapter, **auth_kwargs)
+        # The client's session already retries connection errors; retrying in
+        # the adapter as well would multiply the attempts per call
+        adapter.max_retries = Retry(0, read=False)
         # Set a sensible default timeout so requests don't hang forever
-        client = JIRA(server=server.url, timeout=REQUEST_TIMEOUT_SECONDS, **auth_kwargs)
-        # Fetch profile to verify credentials; allow a couple of retries for transient faults
-        attempts = 3
-        last_ex: Exception | None = None
-        for i in range(1, attempts + 1):
-            try:
-                profile = client.myself()
-                return client, profile
-            except Exception as ex:  # noqa: BLE001
-                last_ex = ex
-                # Only retry on transient network conditions
-                transient = isinstance(
-                    ex,
-                    (RequestsConnectionError, RequestsReadTimeout, Urllib3ReadTimeout),
-                ) or (
-                    isinstance(ex, JIRAError)
-                    and ex.status_code in {429, 500, 502, 503, 504}
-                )
-                if not transient or i == attempts:
-                    break
-                delay = 0.5 * (2 ** (i - 1))
-                time.sleep(delay)
-        assert last_ex is not None
-        raise last_ex
+        client = JIRA(
+            server=server.url,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            get_server_info=False,
+            **auth_kwargs,
+        )
+        for prefix in HTTP_ADAPTER_PREFIXES:
+            client._session.mount(prefix, adapter)
+        if server.auth_type != "pat":
+            # Load the server info ourselves so it reuses the probe's connection;
+            # search needs the deployment type to pick the Cloud endpoints.
+            # PATs only exist on Server/Data Center, where none of the calls
+            # made here depend on it.
+            server_info = client.server_info()
+            client._version = tuple(server_info["versionNumbers"])
+            client.deploymentType = server_info.get("deploymentType")
+        return client, profile
 
     authenticator = JiraAuthenticator(
         strategies=[PatAuthStrategy(), CloudTokenAuthStrategy()]
     )
-    return authenticator.authenticate(server, _attempt_connection)
+    client, profile = authenticator.authenticate(server, _attempt_connection)
+    server.profile = profile
+    return client, profile
+
+
+@functools.cache
+def _view_choices(
+    team_issue_jql: str, project_keys: tuple[str, ...]
+) -> tuple[questionary.Choice | questionary.Separator, ...]:
+    """Return the view selector entries for a server's configured views."""
+    choices: list[questionary.Choice | questionary.Separator] = [
+        questionary.Choice(
+            title="My assigned issues",
+            description="Issues assigned to you and not Done",
+            value=VIEW_MY_ISSUES,
+            shortcut_key="m",
+        )
+    ]
+    if team_issue_jql:
+        choices.append(
+            questionary.Choice(
+                title="Shared/team buckets",
+                description="Your configured team JQL",
+                value=VIEW_TEAM_ISSUES,
+                shortcut_key="t",
+            )
+        )
+    if project_keys:
+        project_list = ", ".join(project_keys)
+        choices.append(
+            questionary.Choice(
+                title="All project tickets",
+                description=f"Issues in projects: {project_list}",
+                value=VIEW_PROJECT_ISSUES,
+                shortcut_key="p",
+            )
+        )
+    choices.append(questionary.Separator())
+    choices.append(
+        questionary.Choice(
+            title="Search Jira by keywords",
+            description="Run a quick summary/description search",
+            value=SEARCH_BY_TEXT_VALUE,
+            shortcut_key="s",
+        )
+    )
+    choices.append(
+        questionary.Choice(
+            title="Search Jira with custom JQL",
+            description="Paste or type any JQL query",
+            value=SEARCH_BY_JQL_VALUE,
+        )
+    )
+    choices.append(
+        questionary.Choice(
+            title="Enter issue key manually",
+            value=MANUAL_ENTRY_VALUE,
+        )
+    )
+    return tuple(choices)
+
+
+def _issue_choice(issue: Issue) -> questionary.Choice:
+    # The picker's search filter only matches the title, so the summary is
+    # kept whole for every word of it to be searchable
+    return questionary.Choice(
+        title=f"{issue.key} - {issue.fields.summary}",
+        description=f"Status: {issue.fields.status}",
+        value=issue.key,
+    )
+
+
+def _run_in_background(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Call ``func`` on a daemon thread and return a future for its result.
+
+    Unlike executor workers, daemon threads are not joined at exit, so a
+    search for a view the user never opens cannot keep the CLI from quitting.
+    """
+    future: Future = Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as ex:  # noqa: BLE001 handed to the caller
+            future.set_exception(ex)
+
+    threading.Thread(target=_run, name="jira-prefetch", daemon=True).start()
+    return future
 
 
 class IssueSelectionFlow:
@@ -553,18 +998,60 @@ class IssueSelectionFlow:
         *,
         prompt: QuestionaryIO,
         jira_service: JiraService,
-        spinner_factory: Callable[..., Halo] = Halo,
+        spinner_factory: Callable[..., Halo] = shared_spinner,
+        issue_cache: IssueCache | None = None,
     ) -> None:
         self._prompt = prompt
         self._jira_service = jira_service
         self._spinner_factory = spinner_factory
+        self.issue_cache = issue_cache if issue_cache is not None else IssueCache()
+        # jql -> (submitted at, pending or finished search)
+        self._prefetched: dict[str, tuple[float, Future[list[Issue]]]] = {}
+        # (jql, limit) -> (fetched at, issue keys); issues live in issue_cache
+        self._session_results: dict[tuple[str, int | None], tuple[float, list[str]]] = (
+            {}
+        )
+
+    def prefetch(self, server: Server) -> None:
+        """Start loading the first page of each configured view in the background.
+
+        The searches overlap with the user reading the view selector; picking a
+        view afterwards waits for its pending result instead of searching again,
+        unless the view has more than one page of issues.
+        Views with a search started or results loaded within the cache TTL are
+        skipped, so this is called every time the view selector is shown.
+        """
+        view_jqls = (
+            server.issue_jql or DEFAULT_ISSUE_JQL,
+            server.team_issue_jql,
+            server.project_jql,
+        )
+        for jql in view_jqls:
+            if (
+                not jql
+                or self._prefetched_search(jql) is not None
+                or self._session_result_keys(jql, None) is not None
+            ):
+                continue
+            self._prefetched[jql] = (
+                time.time(),
+                _run_in_background(
+                    self._jira_service.search_issues,
+                    jql,
+                    fields=ISSUE_FIELDS_CSV,
+                    limit=SEARCH_RESULT_LIMIT,
+                ),
+            )
 
     def select_issue(self, server: Server) -> str:
+        view_choices = self._build_view_choices(server)
         selected_issue_key: str | None = None
         while selected_issue_key is None:
+            # Re-arm the views the previous pick consumed or that went stale
+            self.prefetch(server)
             view_choice = self._prompt.select(
                 message="How would you like to find issues?",
-                choices=self._build_view_choices(server),
+                choices=view_choices,
             )
 
             if view_choice == MANUAL_ENTRY_VALUE:
@@ -603,7 +1090,7 @@ class IssueSelectionFlow:
                 continue
 
             if view_choice == VIEW_PROJECT_ISSUES:
-                jql = self._project_jql(server)
+                jql = server.project_jql
                 if not jql:
                     self._prompt.print(
                         "No project keys configured for this server.",
@@ -660,15 +1147,22 @@ class IssueSelectionFlow:
                 ).strip()
                 if not custom_jql:
                     continue
-                issues = self._fetch_issues_with_jql(custom_jql)
-                self._print_issue_count(
-                    message=f"Loaded {len(issues)} issue(s) from custom JQL.",
-                    issues=issues,
-                )
-                chosen_key = self._prompt_issue_selection(
-                    issues=issues,
-                    prompt_message="Select issues from custom JQL",
-                )
+                # Entering the same query again within the cache TTL reuses its
+                # result; the picker's reload choice fetches it from Jira again
+                chosen_key = RELOAD_RESULTS_VALUE
+                refresh = False
+                while chosen_key == RELOAD_RESULTS_VALUE:
+                    issues = self._fetch_issues_with_jql(custom_jql, refresh=refresh)
+                    self._print_issue_count(
+                        message=f"Loaded {len(issues)} issue(s) from custom JQL.",
+                        issues=issues,
+                    )
+                    chosen_key = self._prompt_issue_selection(
+                        issues=issues,
+                        prompt_message="Select issues from custom JQL",
+                        allow_reload=True,
+                    )
+                    refresh = True
                 if chosen_key:
                     selected_issue_key = chosen_key
                 continue
@@ -692,25 +1186,36 @@ class IssueSelectionFlow:
         jql_to_run: str,
         *,
         limit: int | None = None,
+        refresh: bool = False,
     ) -> list[Issue]:
+        from jira.exceptions import JIRAError
+
         if not jql_to_run:
             return []
 
+        cached = None if refresh else self._session_result(jql_to_run, limit)
+        if cached is not None:
+            return cached
+
+        prefetched = (
+            self._prefetched_search(jql_to_run)
+            if limit is None and not refresh
+            else None
+        )
+        self._prefetched.pop(jql_to_run, None)
         spinner = self._spinner_factory(text="Loading issues...", spinner="pong")
         spinner.start()
         try:
-            issues = self._jira_service.search_issues(
-                jql_to_run,
-                fields=ISSUE_FIELDS,
-                limit=limit,
-            )
-        except (
-            JIRAError,
-            RequestsReadTimeout,
-            RequestsConnectionError,
-            Urllib3ReadTimeout,
-            RequestException,
-        ) as ex:
+            issues = prefetched.result() if prefetched is not None else None
+            if issues is None or len(issues) >= SEARCH_RESULT_LIMIT:
+                # Not prefetched, or only the first page was; load all of it
+                issues = self._jira_service.search_issues(
+                    jql_to_run,
+                    fields=ISSUE_FIELDS_CSV,
+                    limit=limit,
+                    refresh=refresh,
+                )
+        except _jira_call_errors() as ex:
             self._prompt.print(
                 f"Failed to run JQL search: {ex.text if isinstance(ex, JIRAError) else str(ex)}",
                 style="fg:ansired",
@@ -719,10 +1224,44 @@ class IssueSelectionFlow:
         finally:
             spinner.stop()
 
+        # Interned once so the caches share one string per key across views
+        keys = [sys.intern(issue.key) for issue in issues]
+        self.issue_cache.update(zip(keys, issues))
+        self._session_results[(jql_to_run, limit)] = (time.time(), keys)
         return issues
 
+    def _prefetched_search(self, jql: str) -> Future[list[Issue]] | None:
+        entry = self._prefetched.get(jql)
+        if entry is None:
+            return None
+        submitted_at, future = entry
+        if time.time() - submitted_at > SEARCH_CACHE_TTL_SECONDS:
+            # Started too long ago, e.g. before a long timer; search again
+            del self._prefetched[jql]
+            return None
+        return future
+
+    def _session_result(self, jql: str, limit: int | None) -> list[Issue] | None:
+        keys = self._session_result_keys(jql, limit)
+        if keys is None:
+            return None
+        return [self.issue_cache[key] for key in keys]
+
+    def _session_result_keys(self, jql: str, limit: int | None) -> list[str] | None:
+        entry = self._session_results.get((jql, limit))
+        if entry is None:
+            return None
+        fetched_at, keys = entry
+        if time.time() - fetched_at > SEARCH_CACHE_TTL_SECONDS or not all(
+            key in self.issue_cache for key in keys
+        ):
+            # Stale, or some issues were evicted from the LRU; search again
+            del self._session_results[(jql, limit)]
+            return None
+        return keys
+
     def _build_keyword_search_jql(self, term: str) -> str:
-        escaped_term = term.replace('"', '"')
+        escaped_term = term.translate(JQL_ESCAPE_TABLE)
         clauses = [
             f'summary ~ "{escaped_term}"',
             f'description ~ "{escaped_term}"',
@@ -730,67 +1269,19 @@ class IssueSelectionFlow:
         normalized_key = term.strip().upper()
         if ISSUE_KEY_PATTERN.match(normalized_key):
             clauses.insert(0, f'key = "{normalized_key}"')
-        return " OR ".join(clauses) + " ORDER BY updated DESC"
+        return f"{' OR '.join(clauses)}{JQL_ORDER_BY_UPDATED}"
 
     def _build_view_choices(
         self, server: Server
-    ) -> list[questionary.Choice | questionary.Separator]:
-        choices: list[questionary.Choice | questionary.Separator] = [
-            questionary.Choice(
-                title="My assigned issues",
-                description="Issues assigned to you and not Done",
-                value=VIEW_MY_ISSUES,
-                shortcut_key="m",
-            )
-        ]
-        if server.team_issue_jql:
-            choices.append(
-                questionary.Choice(
-                    title="Shared/team buckets",
-                    description="Your configured team JQL",
-                    value=VIEW_TEAM_ISSUES,
-                    shortcut_key="t",
-                )
-            )
-        if server.project_keys:
-            project_list = ", ".join(server.project_keys)
-            choices.append(
-                questionary.Choice(
-                    title="All project tickets",
-                    description=f"Issues in projects: {project_list}",
-                    value=VIEW_PROJECT_ISSUES,
-                    shortcut_key="p",
-                )
-            )
-        choices.append(questionary.Separator())
-        choices.append(
-            questionary.Choice(
-                title="Search Jira by keywords",
-                description="Run a quick summary/description search",
-                value=SEARCH_BY_TEXT_VALUE,
-                shortcut_key="s",
-            )
-        )
-        choices.append(
-            questionary.Choice(
-                title="Search Jira with custom JQL",
-                description="Paste or type any JQL query",
-                value=SEARCH_BY_JQL_VALUE,
-            )
-        )
-        choices.append(
-            questionary.Choice(
-                title="Enter issue key manually",
-                value=MANUAL_ENTRY_VALUE,
-            )
-        )
-        return choices
+    ) -> tuple[questionary.Choice | questionary.Separator, ...]:
+        return _view_choices(server.team_issue_jql, tuple(server.project_keys))
 
     def _prompt_issue_selection(
         self,
         *,
         issues: list[Issue],
         prompt_message: str,
+        allow_reload: bool = False,
     ) -> str | None:
         if not issues:
             self._prompt.print(
@@ -799,26 +1290,33 @@ class IssueSelectionFlow:
             )
             return None
 
+        # questionary needs len() on its choices, so they are built into the
+        # one list passed to the prompt rather than handed over lazily
         choices: list[questionary.Choice | questionary.Separator] = [
-            questionary.Choice(
-                title=f"{issue.key} - {issue.fields.summary}",
-                description=f"Status: {issue.fields.status}",
-                value=issue.key,
-            )
-            for issue in issues
-        ]
-        choices.append(questionary.Separator())
-        choices.append(
+            *map(_issue_choice, issues),
+            questionary.Separator(),
             questionary.Choice(
                 title="Back to view selector",
                 value=RETURN_TO_VIEWS_VALUE,
                 shortcut_key="b",
+            ),
+        ]
+        if allow_reload:
+            choices.append(
+                questionary.Choice(
+                    title="Reload from Jira",
+                    value=RELOAD_RESULTS_VALUE,
+                    shortcut_key="r",
+                )
             )
-        )
 
         selected_value = self._prompt.select(
             message=prompt_message,
-            instruction="Use arrows to pick an issue or press 'b' to go back.",
+            instruction=(
+                "Use arrows to pick an issue, press 'b' to go back or 'r' to reload."
+                if allow_reload
+                else "Use arrows to pick an issue or press 'b' to go back."
+            ),
             choices=choices,
             use_search_filter=True,
             use_jk_keys=False,
@@ -834,21 +1332,15 @@ class IssueSelectionFlow:
                 message="Enter the Jira issue key:",
                 instruction="For example: TEAM-123",
                 validate=lambda text: True
-                if len(text.strip()) > 0
-                else "Please enter a value",
+                if ISSUE_KEY_PATTERN.match(text.strip().upper())
+                else "Please enter an issue key such as TEAM-123",
             )
             .strip()
             .upper()
         )
         if not manual_key:
             return None
-        return manual_key
-
-    def _project_jql(self, server: Server) -> str | None:
-        if not server.project_keys:
-            return None
-        project_list = ", ".join(server.project_keys)
-        return f"project in ({project_list}) AND statusCategory not in (Done)"
+        return sys.intern(manual_key)
 
     def _print_issue_count(self, *, message: str, issues: list[Issue]) -> None:
         self._prompt.print(
@@ -863,8 +1355,8 @@ class WorklogFlow:
         *,
         prompt: QuestionaryIO,
         jira_service: JiraService,
-        clock: Callable[[], datetime.datetime] = datetime.datetime.now,
-        spinner_factory: Callable[..., Halo] = Halo,
+        clock: Callable[[], datetime] = datetime.now,
+        spinner_factory: Callable[..., Halo] = shared_spinner,
     ) -> None:
         self._prompt = prompt
         self._jira_service = jira_service
@@ -872,6 +1364,8 @@ class WorklogFlow:
         self._spinner_factory = spinner_factory
 
     def log_time(self, issue_key: str) -> bool:
+        from jira.exceptions import JIRAError
+
         log_method = self._prompt_log_method()
 
         time_spent = "0m"
@@ -903,6 +1397,7 @@ class WorklogFlow:
             spinner = self._spinner_factory(
                 text="Tracking time...",
                 spinner="dots12",
+                interval=TIMER_SPINNER_INTERVAL_MS,
             )
             spinner.start()
             try:
@@ -910,8 +1405,9 @@ class WorklogFlow:
             finally:
                 spinner.stop()
             stop_time = self._clock()
-            seconds_spent = max((stop_time - start_time).total_seconds(), 0)
-            minutes_spent = max(int(round(seconds_spent / 60.0)), 1)
+            seconds_spent = int((stop_time - start_time).total_seconds())
+            # Round half up to whole minutes, logging at least one
+            minutes_spent = max((seconds_spent + 30) // 60, 1)
             time_spent = f"{minutes_spent}m"
             self._prompt.print(
                 f"Timer stopped after approximately {minutes_spent} minute(s).",
@@ -957,13 +1453,7 @@ class WorklogFlow:
                     f"Added worklog to issue {issue_key}", style="fg:ansigreen"
                 )
                 return True
-            except (
-                JIRAError,
-                RequestsReadTimeout,
-                RequestsConnectionError,
-                Urllib3ReadTimeout,
-                RequestException,
-            ) as ex:  # noqa: PERF203
+            except _jira_call_errors() as ex:  # noqa: PERF203
                 # Give a concise, user-friendly error and option to retry
                 error_text = ex.text if isinstance(ex, JIRAError) else str(ex)
                 self._prompt.print(
@@ -972,10 +1462,7 @@ class WorklogFlow:
                 )
                 retry = self._prompt.select(
                     message="Do you want to retry submitting the worklog?",
-                    choices=[
-                        questionary.Choice(title="Yes, retry.", value=True),
-                        questionary.Choice(title="No, cancel.", value=False),
-                    ],
+                    choices=RETRY_WORKLOG_CHOICES,
                 )
                 if not retry:
                     return False
@@ -984,26 +1471,7 @@ class WorklogFlow:
         return self._prompt.select(
             message="How do you want to log the time?",
             default="auto",
-            choices=[
-                questionary.Choice(
-                    title="Start Timer",
-                    description="Begin a timer now and stop it when you're done.",
-                    value="auto",
-                    shortcut_key="t",
-                ),
-                questionary.Choice(
-                    title="Manual Time Entry",
-                    description='Enter a duration such as "1h" or "30m".',
-                    value="manual",
-                    shortcut_key="m",
-                ),
-                questionary.Choice(
-                    title="Back to issue selection",
-                    description="Return and pick a different issue.",
-                    value=RETURN_TO_LOG_METHOD_VALUE,
-                    shortcut_key="b",
-                ),
-            ],
+            choices=LOG_METHOD_CHOICES,
             instruction="Use arrows to choose or press 'b' to go back.",
         )
 
@@ -1013,27 +1481,73 @@ def _select_server(
     prompt: QuestionaryIO,
     prompter: ServerPrompter,
 ) -> Server:
+    server_choices: list[questionary.Choice | questionary.Separator] = [
+        questionary.Choice(title=s.choice_title, value=s) for s in config.servers
+    ]
+    server_choices.append(questionary.Separator())
+    server_choices.append(
+        questionary.Choice(title="Add a new server", value="add_new_server")
+    )
     current_server: Server | None = None
     while current_server is None:
-        server_choices = [
-            questionary.Choice(title=f"{s.name} - {s.url}", value=s)
-            for s in config.servers
-        ]
-        server_choices.append(questionary.Separator())
-        server_choices.append(
-            questionary.Choice(title="Add a new server", value="add_new_server")
-        )
         selection = prompt.select(
             message="Please select a server to work with",
             choices=server_choices,
         )
         if selection == "add_new_server":
-            add_new_server(config, prompter)
+            new_server = add_new_server(config, prompter)
+            # Server names are unique, so the new one only needs to be added
+            server_choices.insert(
+                -2, questionary.Choice(title=new_server.choice_title, value=new_server)
+            )
             continue
         current_server = selection
     return current_server
 
 
+def _log_one_ticket(
+    *,
+    prompt: QuestionaryIO,
+    server: Server,
+    jira_service: JiraService,
+    issue_flow: IssueSelectionFlow,
+    worklog_flow: WorklogFlow,
+) -> bool:
+    """Select an issue, log time against it and ask whether to continue."""
+    from jira.exceptions import JIRAError
+
+    worklog_created = False
+    while not worklog_created:
+        issue_key = issue_flow.select_issue(server)
+
+        # Keys picked from search results are known to exist; only manually
+        # entered keys need a round-trip to confirm them.
+        if issue_key not in issue_flow.issue_cache:
+            try:
+                jira_service.get_issue(issue_key, fields=["id"])
+            except _jira_call_errors() as ex:
+                text = ex.text if isinstance(ex, JIRAError) else str(ex)
+                prompt.print(
+                    f"Failed to confirm issue '{issue_key}': {text}", style="fg:ansired"
+                )
+                retry_issue = prompt.select(
+                    message="Try to confirm the issue again?",
+                    choices=RETRY_ISSUE_CHOICES,
+                )
+                if not retry_issue:
+                    continue
+                # Retry once more via loop by not setting worklog_created
+                continue
+            logging.debug("Selected issue exists")
+
+        worklog_created = worklog_flow.log_time(issue_key)
+
+    return prompt.select(
+        message="Work on another ticket?",
+        choices=YES_NO_CHOICES,
+    )
+
+
 def main(
     args: dict[str, str] | None = None,
     server: Server | None = None,
@@ -1041,8 +1555,8 @@ def main(
     myself: dict[str, Any] | None = None,
     *,
     prompt: QuestionaryIO | None = None,
-    clock: Callable[[], datetime.datetime] = datetime.datetime.now,
-    spinner_factory: Callable[..., Halo] = Halo,
+    clock: Callable[[], datetime] = datetime.now,
+    spinner_factory: Callable[..., Halo] = shared_spinner,
 ) -> None:
     """The main program"""
     prompt = prompt or QuestionaryIO()
@@ -1056,6 +1570,8 @@ def main(
     active_server = server or _select_server(config, prompt, server_prompter)
     assert active_server is not None
 
+    from jira.exceptions import JIRAError
+
     jira_client = jira
     profile = myself
 
@@ -1070,30 +1586,37 @@ def main(
                 )
                 sys.exit(1)
             raise
-
-    jira_service = JiraService(jira_client)
-
-    if profile is None:
+    elif profile is None and active_server.profile is not None:
+        profile = active_server.profile
+    elif profile is None:
         try:
-            profile = jira_service.myself()
+            profile = JiraService(jira_client).myself()
         except JIRAError as ex:
-            if ex.status_code == 401:
-                jira_client, profile = connect_to_jira(active_server)
-                jira_service = JiraService(jira_client)
-            else:
+            if ex.status_code != 401:
                 raise
-        logging.debug(
-            "You're authenticated with JIRA (%s) as: %s - %s (%s)",
-            active_server.url,
-            profile["name"],
-            profile["displayName"],
-            profile["emailAddress"],
-        )
+            jira_client, profile = connect_to_jira(active_server)
+        active_server.profile = profile
+
+    # From here on the session is authenticated; the ticket loop below only
+    # talks to Jira for searches and worklogs.
+    assert jira_client is not None and profile is not None
+    logging.debug(
+        "You're authenticated with JIRA (%s) as: %s - %s (%s)",
+        active_server.url,
+        profile.get("name"),
+        profile.get("displayName"),
+        profile.get("emailAddress"),
+    )
+
+    jira_service = JiraService(
+        jira_client, search_cache=SearchCache(scope=active_server.name)
+    )
 
     issue_flow = IssueSelectionFlow(
         prompt=prompt,
         jira_service=jira_service,
         spinner_factory=spinner_factory,
+        issue_cache=IssueCache(),
     )
     worklog_flow = WorklogFlow(
         prompt=prompt,
@@ -1102,56 +1625,14 @@ def main(
         spinner_factory=spinner_factory,
     )
 
-    worklog_created = False
-    while not worklog_created:
-        issue_key = issue_flow.select_issue(active_server)
-
-        try:
-            jira_service.get_issue(issue_key, fields=["id", "key"])
-        except (
-            JIRAError,
-            RequestsReadTimeout,
-            RequestsConnectionError,
-            Urllib3ReadTimeout,
-            RequestException,
-        ) as ex:
-            text = ex.text if isinstance(ex, JIRAError) else str(ex)
-            prompt.print(
-                f"Failed to confirm issue '{issue_key}': {text}", style="fg:ansired"
-            )
-            retry_issue = prompt.select(
-                message="Try to confirm the issue again?",
-                choices=[
-                    questionary.Choice(title="Yes, retry.", value=True),
-                    questionary.Choice(title="No, go back to selection.", value=False),
-                ],
-            )
-            if not retry_issue:
-                continue
-            # Retry once more via loop by not setting worklog_created
-            continue
-        logging.debug("Selected issue exists")
-
-        worklog_created = worklog_flow.log_time(issue_key)
-
-    _continue = prompt.select(
-        message="Work on another ticket?",
-        choices=[
-            questionary.Choice(title="Yes.", value=True),
-            questionary.Choice(title="No.", value=False),
-        ],
-    )
-
-    if _continue:
-        main(
-            args,
-            server=active_server,
-            jira=jira_client,
-            myself=profile,
-            prompt=prompt,
-            clock=clock,
-            spinner_factory=spinner_factory,
-        )
+    while _log_one_ticket(
+        prompt=prompt,
+        server=active_server,
+        jira_service=jira_service,
+        issue_flow=issue_flow,
+        worklog_flow=worklog_flow,
+    ):
+        pass
 
 
 def cli(args: dict[str, str] | None = None) -> None:
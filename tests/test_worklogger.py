@@ -0,0 +1,312 @@
+import os
+import stat
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
+
+from jira_time import worklogger
+from jira_time.worklogger import (
+    CloudTokenAuthStrategy,
+    Config,
+    IssueCache,
+    IssueSelectionFlow,
+    SearchCache,
+    Server,
+    WorklogFlow,
+)
+
+KEY = ("https://jira.example.com", "assignee = currentUser()", "summary,status", 50)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SearchCache(cache_dir=tmp_path, ttl_seconds=60)
+
+
+def _age(path, seconds):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_search_cache_round_trip(cache):
+    cache.put(KEY, [{"key": "ABC-1"}])
+    assert cache.get(KEY) == [{"key": "ABC-1"}]
+
+
+def test_search_cache_caches_empty_results(cache):
+    cache.put(KEY, [])
+    assert cache.get(KEY) == []
+
+
+def test_search_cache_expires_entries(cache, monkeypatch):
+    cache.put(KEY, [{"key": "ABC-1"}])
+    now = time.time()
+    monkeypatch.setattr(worklogger.time, "time", lambda: now + 61)
+    assert cache.get(KEY) is None
+    assert not list(cache.cache_dir.glob("*.pickle"))
+
+
+def test_search_cache_is_scoped_per_account(tmp_path):
+    SearchCache(cache_dir=tmp_path, scope="work").put(KEY, [{"key": "ABC-1"}])
+    assert SearchCache(cache_dir=tmp_path, scope="personal").get(KEY) is None
+    assert SearchCache(cache_dir=tmp_path, scope="work").get(KEY) is not None
+
+
+def test_search_cache_discard_issue(cache):
+    other_key = KEY[:1] + ("project = XYZ",) + KEY[2:]
+    cache.put(KEY, [{"key": "ABC-1"}, {"key": "ABC-2"}])
+    cache.put(other_key, [{"key": "XYZ-1"}])
+
+    cache.discard_issue("ABC-2")
+
+    assert cache.get(KEY) is None
+    assert cache.get(other_key) == [{"key": "XYZ-1"}]
+
+
+def test_search_cache_discard_issue_without_cache_dir(tmp_path):
+    SearchCache(cache_dir=tmp_path / "missing").discard_issue("ABC-1")
+
+
+def test_search_cache_prunes_expired_entries_on_put(cache):
+    stale_key = KEY[:1] + ("project = OLD",) + KEY[2:]
+    cache.put(stale_key, [{"key": "OLD-1"}])
+    (stale_path,) = cache.cache_dir.glob("*.pickle")
+    _age(stale_path, 120)
+
+    cache.put(KEY, [{"key": "ABC-1"}])
+
+    assert not stale_path.exists()
+    assert cache.get(KEY) == [{"key": "ABC-1"}]
+
+
+def test_search_cache_drops_corrupt_entries(cache):
+    cache.put(KEY, [{"key": "ABC-1"}])
+    (path,) = cache.cache_dir.glob("*.pickle")
+    path.write_bytes(b"not a pickle")
+
+    assert cache.get(KEY) is None
+    assert not path.exists()
+
+
+def test_issue_cache_evicts_least_recently_used():
+    issues = IssueCache(maxsize=2)
+    issues["ABC-1"] = "one"
+    issues["ABC-2"] = "two"
+    assert issues["ABC-1"] == "one"
+
+    issues["ABC-3"] = "three"
+
+    assert list(issues) == ["ABC-1", "ABC-3"]
+
+
+CONFIG = """\
+[work]
+url = https://jira.example.com
+auth_type = pat
+pat = secret
+"""
+
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch):
+    monkeypatch.setattr(worklogger.pathlib.Path, "home", lambda: tmp_path)
+    return tmp_path / ".config" / "jira-time"
+
+
+def test_config_load_without_file(config_home):
+    config = Config()
+    config.load()
+    assert config.servers == []
+
+
+def test_config_load_picks_up_changes(config_home):
+    config_home.mkdir(parents=True)
+    config_path = config_home / "jira-time.conf"
+    config_path.write_text(CONFIG, encoding="utf-8")
+    config = Config()
+    config.load()
+
+    config_path.write_text(
+        CONFIG + "\n[personal]\nurl = https://example.atlassian.net\npat = other\n",
+        encoding="utf-8",
+    )
+    config.load()
+
+    assert [server.name for server in config.servers] == ["work", "personal"]
+
+
+def test_config_write_replaces_file_and_keeps_its_mode(config_home):
+    config_home.mkdir(parents=True)
+    config_path = config_home / "jira-time.conf"
+    config_path.write_text(CONFIG, encoding="utf-8")
+    config_path.chmod(0o600)
+    config = Config()
+    config.load()
+
+    config.add_server(
+        Server(auth_type="pat", url="https://other.example.com", name="other", pat="x")
+    )
+    config.write(autoreload=True)
+
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+    assert not list(config_home.glob("*.tmp"))
+    assert [server.name for server in config.servers] == ["work", "other"]
+    reloaded = Config()
+    reloaded.load()
+    assert [server.name for server in reloaded.servers] == ["work", "other"]
+
+
+def _cloud_server(email="me@example.com"):
+    return Server(
+        auth_type="cloud_token",
+        url="https://example.atlassian.net",
+        name="cloud",
+        email=email,
+        api_token="token",
+    )
+
+
+class _Connector:
+    """Records the auth each attempt used; fails basic auth with a status."""
+
+    def __init__(self, basic_status=None):
+        self.basic_status = basic_status
+        self.calls = []
+
+    def __call__(self, **auth_kwargs):
+        self.calls.append(auth_kwargs)
+        if "basic_auth" in auth_kwargs and self.basic_status is not None:
+            raise JIRAError(status_code=self.basic_status, text="rejected")
+        return "client", {"name": "me"}
+
+
+def test_cloud_token_without_email_uses_bearer():
+    connector = _Connector()
+    CloudTokenAuthStrategy().authenticate(_cloud_server(email="me"), connector)
+    assert connector.calls == [{"token_auth": "token"}]
+
+
+def test_cloud_token_uses_basic_auth():
+    connector = _Connector()
+    CloudTokenAuthStrategy().authenticate(_cloud_server(), connector)
+    assert connector.calls == [{"basic_auth": ("me@example.com", "token")}]
+
+
+def test_cloud_token_falls_back_to_bearer_on_401():
+    connector = _Connector(basic_status=401)
+    assert CloudTokenAuthStrategy().authenticate(_cloud_server(), connector) == (
+        "client",
+        {"name": "me"},
+    )
+    assert connector.calls == [
+        {"basic_auth": ("me@example.com", "token")},
+        {"token_auth": "token"},
+    ]
+
+
+def test_cloud_token_reraises_403():
+    connector = _Connector(basic_status=403)
+    with pytest.raises(JIRAError) as excinfo:
+        CloudTokenAuthStrategy().authenticate(_cloud_server(), connector)
+    assert excinfo.value.status_code == 403
+    assert len(connector.calls) == 1
+
+
+@pytest.fixture
+def jira_stub():
+    """A local HTTP server answering /myself with a configurable status."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = b'{"name": "me"}' if server.status == 200 else b"denied"
+            self.send_response(server.status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.status = 200
+    threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    ).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _stub_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_probe_auth_returns_profile(jira_stub):
+    profile = worklogger._probe_auth(
+        _stub_url(jira_stub), HTTPAdapter(), token_auth="token"
+    )
+    assert profile == {"name": "me"}
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_probe_auth_raises_status(jira_stub, status):
+    jira_stub.status = status
+    with pytest.raises(JIRAError) as excinfo:
+        worklogger._probe_auth(
+            _stub_url(jira_stub), HTTPAdapter(), basic_auth=("me", "token")
+        )
+    assert excinfo.value.status_code == status
+
+
+def test_keyword_search_escapes_quotes_and_backslashes():
+    flow = IssueSelectionFlow(prompt=None, jira_service=None)
+    jql = flow._build_keyword_search_jql('say "hi" \\ now')
+    assert jql == (
+        'summary ~ "say \\"hi\\" \\\\ now" OR '
+        'description ~ "say \\"hi\\" \\\\ now" ORDER BY updated DESC'
+    )
+
+
+def test_keyword_search_matches_issue_keys():
+    flow = IssueSelectionFlow(prompt=None, jira_service=None)
+    assert flow._build_keyword_search_jql("abc-12").startswith('key = "ABC-12" OR ')
+
+
+class _TimerPrompt:
+    def select(self, **kwargs):
+        # Pick the timer, then accept the tracked time
+        return "auto" if kwargs["message"].startswith("How do you") else True
+
+    def text(self, **kwargs):
+        return ""
+
+    def print(self, *args, **kwargs):
+        pass
+
+
+@pytest.mark.parametrize(
+    ("seconds", "logged"),
+    [(0, "1m"), (29, "1m"), (89, "1m"), (90, "2m"), (3599, "60m")],
+)
+def test_timer_rounds_to_nearest_minute(monkeypatch, seconds, logged):
+    start = datetime(2024, 1, 1, 9)
+    times = iter([start, start + timedelta(seconds=seconds)])
+    worklogs = []
+    service = SimpleNamespace(add_worklog=lambda **kwargs: worklogs.append(kwargs))
+    spinner = SimpleNamespace(start=lambda: None, stop=lambda: None)
+    monkeypatch.setattr("builtins.input", lambda: "")
+    flow = WorklogFlow(
+        prompt=_TimerPrompt(),
+        jira_service=service,
+        clock=lambda: next(times),
+        spinner_factory=lambda **kwargs: spinner,
+    )
+
+    assert flow.log_time("ABC-1")
+    assert worklogs[0]["time_spent"] == logged